@@ -9,7 +9,7 @@ Version: 2.0
 
 Description:
 Pixel-based Snake game using Python and Tkinter.
-Each snake segment is a separate window for smooth movement.
+Snake segments and fruit are drawn on a single transparent overlay window.
 Features:
     - Snake growth and movement
     - Fruit spawning and collision detection
@@ -26,15 +26,16 @@ Controls:
 
 Notes:
     - Designed for macOS.
-    - Time.sleep() controls game speed.
+    - FRAME_DELAY controls game speed.
     - Key handling prevents system beeps on invalid keys.
 
 ===============================================================================
 """
 
 
-from tkinter import Tk, Toplevel, Label
-import time, random
+from tkinter import Tk, Toplevel, Label, Canvas
+from collections import deque
+import random
 
 # Initialize main window
 root = Tk()
@@ -61,9 +62,40 @@ GRID_HEIGHT = USABLE_HEIGHT - (USABLE_HEIGHT % PIXEL_SIZE)
 GRID_WIDTH_START = (SCREEN_WIDTH - GRID_WIDTH) // 2
 GRID_HEIGHT_START = TOP_MARGIN + (USABLE_HEIGHT - GRID_HEIGHT) // 2
 
+# Screen coordinates of every grid column and row, and every cell, used to place fruit
+X_CELLS = tuple(range(GRID_WIDTH_START, GRID_WIDTH_START + GRID_WIDTH, PIXEL))
+Y_CELLS = tuple(range(GRID_HEIGHT_START, GRID_HEIGHT_START + GRID_HEIGHT, PIXEL))
+ALL_CELLS = tuple((x, y) for y in Y_CELLS for x in X_CELLS)
+
+# Transparent borderless overlay holding every snake segment and fruit
+canvas_win = Toplevel(root)
+canvas_win.overrideredirect(True)
+canvas_win.attributes("-transparent", True)
+canvas_win.attributes("-topmost", True)  # keep the game above other apps
+canvas_win.config(bg="systemTransparent")
+canvas_win.geometry(f"{GRID_WIDTH}x{GRID_HEIGHT}+{GRID_WIDTH_START}+{GRID_HEIGHT_START}")
+
+canvas = Canvas(canvas_win, bg="systemTransparent", highlightthickness=0)
+canvas.pack(fill="both", expand=True)
+
+# Scroll the view so canvas coordinates match screen coordinates
+canvas.config(scrollregion=(GRID_WIDTH_START, GRID_HEIGHT_START,
+                            GRID_WIDTH_START + GRID_WIDTH, GRID_HEIGHT_START + GRID_HEIGHT))
+canvas.xview_moveto(0)
+canvas.yview_moveto(0)
+
 # Game state
 is_running = True
-game_active = True
+
+# Milliseconds between game frames
+FRAME_DELAY = 100
+
+# Movement keys mapped to directions; opposite directions are negatives
+KEY_DIRECTIONS = {"w": 1, "Up": 1, "s": -1, "Down": -1,
+                  "a": -2, "Left": -2, "d": 2, "Right": 2}
+
+# Head movement per frame for each direction
+DIRECTION_DELTAS = {1: (0, -PIXEL), -1: (0, PIXEL), -2: (-PIXEL, 0), 2: (PIXEL, 0)}
 
 # Colors
 COLOR_YELLOW = "Yellow"
@@ -74,119 +106,169 @@ COLOR_GREEN = "Green"
 
 class Snake:
 
+    # Hidden rectangles left by previous snakes, reused instead of recreated
+    _item_pool = []
+
     def __init__(self):
 
         # Movement and length properties
-        self.step = PIXEL
         self.direction = -1
         self.snake_length = 6
         self.x_pos, self.y_pos = GRID_WIDTH_START, GRID_HEIGHT_START
-        self.segments = [[self.x_pos, self.y_pos + i*PIXEL] for i in range(self.snake_length)]
-        self.segments.append([None, None])
+        # The body trails above the head so the first downward move is clear
+        self.segments = deque([(self.x_pos, self.y_pos - i*PIXEL) for i in range(self.snake_length)],
+                              maxlen=self.snake_length)
+
+        # Cell the tail last left, where a new segment grows
+        self.vacated = (self.x_pos, self.y_pos - self.snake_length*PIXEL)
+
+        # Cells covered by the body, kept in step with the segments
+        self.occupied = set(self.segments)
+        self.hit_self = False
 
-        # Create windows for each snake segment
-        self.windows = []
+        # Create a canvas rectangle for each snake segment
         self.color = COLOR_GREEN
+        self._last_color = self.color
         self.size = PIXEL
-        
-        for i in range(self.snake_length):
-            self.windows.append(Toplevel(root))
-            self.windows[i].configure(bg=self.color)
-            self.windows[i].overrideredirect(True)
-            self.windows[i].geometry(f"{self.size}x{self.size}+{self.segments[i][0]}+{self.segments[i][1]}")
+
+        # Grid bounds for the head position, and the border warning zone
+        self.x_min, self.x_max = GRID_WIDTH_START, GRID_WIDTH_START + GRID_WIDTH - self.size
+        self.y_min, self.y_max = GRID_HEIGHT_START, GRID_HEIGHT_START + GRID_HEIGHT - self.size
+        self.x_warn_lo, self.x_warn_hi = self.x_min + PIXEL*5, self.x_max - PIXEL*5
+        self.y_warn_lo, self.y_warn_hi = self.y_min + PIXEL*5, self.y_max - PIXEL*5
+
+        self.items = [self.take_item(x, y) for x, y in self.segments]
+
+        # Rectangles form a ring starting at the head, so the tail is just before it
+        self.head_idx = 0
+
+        # Call Tcl directly in the per-frame path, skipping the Canvas wrapper
+        self._tkcall = root.tk.call
+        self._canvas_path = str(canvas)
+
+    def take_item(self, x, y):
+        """Return a segment rectangle at (x, y), reusing a pooled one if available."""
+        if Snake._item_pool:
+            item = Snake._item_pool.pop()
+            canvas.coords(item, x, y, x + self.size, y + self.size)
+            canvas.itemconfig(item, fill=self.color, state="normal")
+            return item
+        return canvas.create_rectangle(x, y, x + self.size, y + self.size,
+                                       fill=self.color, outline="", tags="snake")
+
+    def release(self):
+        """Hide every segment rectangle and return them to the pool."""
+        canvas.itemconfig("snake", state="hidden")
+        Snake._item_pool.extend(self.items)
+
+    def advance(self):
+        """Step the head, body and occupied cells forward without touching the canvas."""
+
+        dx, dy = DIRECTION_DELTAS[self.direction]
+        self.x_pos += dx
+        self.y_pos += dy
+
+        # One head tuple is shared by the occupied set and the segment deque
+        head = (self.x_pos, self.y_pos)
+
+        # The tail cell is vacated before the head can move into it
+        self.vacated = self.segments[-1]
+        self.occupied.discard(self.vacated)
+        self.hit_self = head in self.occupied
+        self.occupied.add(head)
+
+        # The full deque drops the tail, shifting every segment along
+        self.segments.appendleft(head)
 
     def update_position(self):
-        """Move the snake forward one step and update segment windows."""
-
-        if self.direction == 1:
-            self.y_pos -= self.step
-        elif self.direction == -1:
-            self.y_pos += self.step
-        elif self.direction == -2:
-            self.x_pos -= self.step
-        elif self.direction == 2:
-            self.x_pos += self.step
-
-        for i in range(len(self.segments)-1, -1, -1):
-            self.segments[i] = self.segments[i-1]
-            self.segments[i-1] = self.segments[i]
-        self.segments[0] = (self.x_pos, self.y_pos)
-
-        for i in range(len(self.segments)-1):
-            self.windows[i].configure(bg=self.color)
-            self.windows[i].geometry(f"{self.size}x{self.size}+{self.segments[i][0]}+{self.segments[i][1]}")
+        """Move the snake forward one step and update segment rectangles."""
+        self.advance()
+
+        # Recolor every segment at once through the shared tag, only on change
+        if self.color != self._last_color:
+            canvas.itemconfig("snake", fill=self.color)
+            self._last_color = self.color
+
+        # Only the vacated tail rectangle moves, becoming the new head
+        self.head_idx = (self.head_idx - 1) % self.snake_length
+        self._tkcall(self._canvas_path, "coords", self.items[self.head_idx],
+                     self.x_pos, self.y_pos, self.x_pos + self.size, self.y_pos + self.size)
 
     def handle_key(self, event):
         """Handle user input for movement, quitting, and restarting."""
-        global game_active, is_running
+        global is_running
 
-        if event.keysym in ["w", "Up"] and self.direction != -1:
-            self.direction = 1
-        elif event.keysym in ["s", "Down"] and self.direction != 1:
-            self.direction = -1
-        elif event.keysym in ["a", "Left"] and self.direction != 2:
-            self.direction = -2
-        elif event.keysym in ["d", "Right"] and self.direction != -2:
-            self.direction = 2
+        direction = KEY_DIRECTIONS.get(event.keysym)
+        if direction is not None:
+            if direction != -self.direction:
+                self.direction = direction
+            return
 
         if event.keysym == "q":
-            game_active = False
+            root.destroy()
         if event.keysym == "r":
             is_running = False
 
     def check_wall_collision(self):
         """Stop the game if the snake hits a wall."""
         global is_running
-        if (self.x_pos < GRID_WIDTH_START or self.x_pos + self.size > GRID_WIDTH + GRID_WIDTH_START or
-            self.y_pos < GRID_HEIGHT_START or self.y_pos + self.size > GRID_HEIGHT + GRID_HEIGHT_START):
+        if (self.x_pos < self.x_min or self.x_pos > self.x_max or
+            self.y_pos < self.y_min or self.y_pos > self.y_max):
             is_running = False
 
     def check_border_proximity(self):
         """Change color if snake is near the screen border."""
-        if (self.x_pos <= GRID_WIDTH_START+PIXEL*5 or self.x_pos + self.size >= (GRID_WIDTH + GRID_WIDTH_START) - PIXEL*5 or
-            self.y_pos <= GRID_HEIGHT_START + PIXEL*5 or self.y_pos + self.size >= (GRID_HEIGHT + GRID_HEIGHT_START) - PIXEL*5):
+        if (self.x_pos <= self.x_warn_lo or self.x_pos >= self.x_warn_hi or
+            self.y_pos <= self.y_warn_lo or self.y_pos >= self.y_warn_hi):
             self.color = COLOR_YELLOW
         else:
             self.color = COLOR_GREEN
 
     def check_fruit_collision(self):
         """Handle collision with fruit and grow snake."""
-        global is_running, points, fruit
-
         if self.x_pos == fruit.x_pos and self.y_pos == fruit.y_pos:
-            fruit.master.destroy()
-            fruit = Fruit()
             points.add()
             self.snake_length += 1
-            self.segments.append((None, None))
-            self.windows.append(Toplevel(root))
-            self.windows[-1].configure(bg=self.color)
-            self.windows[-1].overrideredirect(True)
-            self.windows[-1].geometry(f"{self.size}x{self.size}+{self.segments[-2][0]}+{self.segments[-2][1]}")
+            self.segments = deque(self.segments, maxlen=self.snake_length)
+            self.segments.append(self.vacated)
+            self.occupied.add(self.vacated)
+            x, y = self.vacated
+            # Insert the new rectangle as the tail of the ring, just before the head
+            self.items.insert(self.head_idx, self.take_item(x, y))
+            self.head_idx += 1
+            fruit.respawn(self.occupied)
             return True
         return False
 
     def check_self_collision(self):
         """Stop the game if snake collides with itself."""
         global is_running
-        for i in range(1, self.snake_length):
-            if (self.x_pos, self.y_pos) == self.segments[i]:
-                is_running = False
+        if self.hit_self:
+            is_running = False
 
 """=== Fruit Class ==="""
 
 class Fruit:
 
-    def __init__(self):
-        self.master = Toplevel(root)
-        self.master.overrideredirect(True)
-        self.master.config(bg=COLOR_RED)
-
+    def __init__(self, occupied):
         self.size = PIXEL
-        self.x_pos = (random.randint(0, GRID_WIDTH // PIXEL - 1) * PIXEL + GRID_WIDTH_START)
-        self.y_pos = (random.randint(0, GRID_HEIGHT // PIXEL - 1) * PIXEL + GRID_HEIGHT_START)
-
-        self.master.geometry(f"{self.size}x{self.size}+{self.x_pos}+{self.y_pos}")
+        self.item = canvas.create_rectangle(0, 0, 0, 0, fill=COLOR_RED, outline="", tags="fruit")
+        self.respawn(occupied)
+
+    def respawn(self, occupied):
+        """Move the existing fruit rectangle to a new free cell."""
+        self.x_pos, self.y_pos = Fruit.sample_free(occupied, random)
+        canvas.coords(self.item, self.x_pos, self.y_pos,
+                      self.x_pos + self.size, self.y_pos + self.size)
+
+    @staticmethod
+    def sample_free(occupied, rng):
+        """Return a random grid cell that is not covered by the snake."""
+        # Probe forward from a random cell instead of re-rolling on a hit
+        idx = rng.randrange(len(ALL_CELLS))
+        while ALL_CELLS[idx] in occupied:
+            idx = (idx + 1) % len(ALL_CELLS)
+        return ALL_CELLS[idx]
 
 """=== Points Class ==="""
 
@@ -210,24 +292,17 @@ class Points:
         """Increment score by one."""
         self.score += 1
         self.label.config(text=f"{self.score}")
-        self.label.pack()
 
     def reset(self):
         """Reset score to zero."""
         self.score = 0
         self.label.config(text=f"{self.score}")
-        self.label.pack()
 
 # Game loop functions
 
 def perform_snake_actions():
     
     """Execute all snake actions for each frame."""
-    # Make the snake on top of everything
-
-    for i in range(len(snake.masters)):
-
-        snake.masters[i].focus_force()
     snake.update_position()
     snake.check_fruit_collision()
     snake.check_self_collision()
@@ -236,26 +311,31 @@ def perform_snake_actions():
 
 # Initialize objects
 snake = Snake()
-fruit = Fruit()
+fruit = Fruit(snake.occupied)
 points = Points()
 
 root.bind_all("<Key>", snake.handle_key)
 
-# Main game loop
-while game_active:
-
-    perform_snake_actions()
+def reset_if_dead():
+    """Rebuild the snake, fruit and score after a death or restart."""
+    global is_running, snake
 
     if not is_running:
-        fruit.master.destroy()
         points.reset()
-        for window in snake.windows:
-            window.destroy()
+        snake.release()
 
         snake = Snake()
-        fruit = Fruit()
+        fruit.respawn(snake.occupied)
         root.bind_all("<Key>", snake.handle_key)
         is_running = True
 
-    root.update()
-    time.sleep(0.1)
+def tick():
+    """Schedule the next frame on Tk's event loop, then run this one."""
+    # Scheduling first keeps the frame rate independent of the frame's own work
+    root.after(FRAME_DELAY, tick)
+    perform_snake_actions()
+    reset_if_dead()
+
+# Main game loop
+root.after(0, tick)
+root.mainloop()